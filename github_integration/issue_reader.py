@@ -1,58 +1,521 @@
+import atexit
+import functools
 import os
+import random
+import re
+import threading
 import time
-from typing import Dict, List, Optional, Union
-import requests
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+import httpx
+import orjson
 from datetime import datetime
 
+# Statuses that signal the API is overloaded or throttling us.
+_THROTTLE_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+# Extracts the page number from a Link header URL without matching per_page.
+_PAGE_PARAM_RE = re.compile(r'[?&]page=(\d+)')
+
+# Fields selected for both issues and pull requests. state is selected per type because
+# IssueState and PullRequestState are distinct enums that GraphQL will not merge.
+_ISSUE_FIELDS = """
+        title
+        body
+        number
+        createdAt
+        updatedAt
+        url
+        labels(first: 100) { nodes { name } }
+        assignees(first: 100) { nodes { login } }
+        comments(first: $commentLimit) {
+          totalCount
+          nodes { author { login } body createdAt }
+          pageInfo { hasNextPage endCursor }
+        }
+"""
+
+# Fetches an issue or pull request together with its labels, assignees and first
+# comments in one round trip, matching REST /issues/{number}, which serves both.
+_ISSUE_WITH_COMMENTS_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!, $commentLimit: Int!) {
+  repository(owner: $owner, name: $repo) {
+    issueOrPullRequest(number: $number) {
+      ... on Issue {
+        state""" + _ISSUE_FIELDS + """      }
+      ... on PullRequest {
+        pullRequestState: state""" + _ISSUE_FIELDS + """      }
+    }
+  }
+}
+"""
+
+class UnrecoverableError(httpx.HTTPStatusError):
+    """
+    Raised for client errors (4xx other than rate limiting) that retrying cannot fix.
+    """
+
+class _TTLCache:
+    """
+    A thread-safe LRU cache whose entries expire after a per-entry time-to-live.
+    
+    Expired entries stay in the cache, still subject to LRU eviction, so they can be
+    revalidated with get_stale() instead of refetched.
+    """
+    
+    __slots__ = ('maxsize', '_data', '_lock')
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                return None
+            self._data.move_to_end(key)
+            return value
+            
+    def get_stale(self, key: Hashable) -> Any:
+        """Return the cached value for key whether or not it has expired, or None if it is missing."""
+        with self._lock:
+            entry = self._data.get(key)
+            return entry[1] if entry is not None else None
+            
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds, evicting the least recently used entry if full."""
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._data.clear()
+
+class _AdaptiveLimiter:
+    """
+    Bounds the number of in-flight requests with an AIMD-adjusted limit.
+    
+    The limit is halved whenever a request is throttled and grows by 0.5 after
+    every 10 unthrottled requests, staying within [min_limit, max_limit].
+    """
+    
+    INCREASE = 0.5
+    DECREASE = 0.5
+    SUCCESSES_PER_INCREASE = 10
+    
+    __slots__ = ('min_limit', 'max_limit', 'limit', '_in_flight', '_successes', '_cond')
+    
+    def __init__(self, max_limit: int, min_limit: int = 1):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(max_limit)
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+        
+    def acquire(self) -> None:
+        """Block until a request slot is free under the current limit."""
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+            
+    def release(self, throttled: bool) -> None:
+        """Free a request slot and adjust the limit based on how the request went."""
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self.limit = max(self.min_limit, self.limit * self.DECREASE)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.SUCCESSES_PER_INCREASE:
+                    self.limit = min(self.max_limit, self.limit + self.INCREASE)
+                    self._successes = 0
+            self._cond.notify_all()
+
+
 class GitHubIssueReader:
     """
     A class to handle reading issues from GitHub repositories for Claude MCP integration.
+    
+    Responses are cached and the same objects are handed to every caller that hits
+    the cache, so treat the dicts and lists returned by the read methods as read-only;
+    copy them before making changes.
     """
     
-    def __init__(self, token: str = None):
+    __slots__ = (
+        'token', 'base_url', 'session', 'max_concurrency', 'max_retries', 'base_delay',
+        'max_delay', 'jitter', '_limiter', '_cache', '_inflight', '_inflight_lock',
+        '_pace_interval', '_next_send_at', '_pace_lock'
+    )
+    
+    # Seconds a cached response stays fresh; comments change more often than issue metadata.
+    ISSUE_TTL = 60
+    COMMENTS_TTL = 30
+    
+    # Start pacing requests once less than this fraction of the quota remains.
+    PACING_THRESHOLD = 0.1
+    
+    # GitHub asks clients to wait at least a minute after a secondary rate limit.
+    SECONDARY_RATE_LIMIT_DELAY = 60
+    
+    def __init__(
+        self,
+        token: str | None = None,
+        max_concurrency: int = 8,
+        cache_maxsize: int = 1024,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
+        transport: httpx.BaseTransport | None = None
+    ):
         """
         Initialize the GitHub issue reader with authentication token.
         
         Args:
             token (str): GitHub Personal Access Token. If not provided, will look for GITHUB_TOKEN env variable.
+            max_concurrency (int): Maximum number of requests in flight at once. The effective limit
+                backs off below this when GitHub throttles and recovers as requests succeed.
+            cache_maxsize (int): Maximum number of responses kept in the in-memory cache (0 disables caching).
+            max_retries (int): Number of times a throttled or 5xx response is retried before giving up.
+            base_delay (float): Backoff delay in seconds before the first retry; doubles on each attempt.
+            max_delay (float): Upper bound in seconds on the backoff delay.
+            jitter (float): Fraction by which each backoff delay is randomly stretched or shrunk.
+            transport (httpx.BaseTransport, optional): Transport to send requests through.
+                Defaults to a pooled HTTP/2 transport.
         """
         self.token = token or os.getenv('GITHUB_TOKEN')
         if not self.token:
             raise ValueError("GitHub token is required. Provide it directly or set GITHUB_TOKEN environment variable.")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
         
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._limiter = _AdaptiveLimiter(max_concurrency)
+        # Minimum spacing between request starts while the quota is low, shared by all threads.
+        self._pace_interval = 0.0
+        self._next_send_at = 0.0
+        self._pace_lock = threading.Lock()
+        self._cache = _TTLCache(cache_maxsize)
+        # Requests currently being fetched, so concurrent callers for the same key share one round trip.
+        self._inflight: dict[Hashable, Future] = {}
+        self._inflight_lock = threading.Lock()
         self.base_url = "https://api.github.com"
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "Claude-MCP-GitHub-Integration"
-        })
-        
-    def _handle_rate_limit(self, response: requests.Response) -> None:
-        """Handle GitHub API rate limiting with exponential backoff."""
-        if response.status_code == 403 and 'X-RateLimit-Remaining' in response.headers:
-            remaining = int(response.headers['X-RateLimit-Remaining'])
-            if remaining == 0:
+        
+        # HTTP/2 multiplexes concurrent requests over a single connection to the API.
+        # The transport only retries failed connects; status retries happen in _make_request.
+        if transport is None:
+            transport = httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                retries=max_retries
+            )
+        # GitHub answers renamed repositories and transferred issues with a 301.
+        self.session = httpx.Client(
+            headers={
+                "Authorization": f"token {self.token}",
+                "Accept": "application/vnd.github.v3+json",
+                "User-Agent": "Claude-MCP-GitHub-Integration"
+            },
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            follow_redirects=True,
+            transport=transport
+        )
+        
+    def _rate_limit_delay(self, response: httpx.Response) -> float | None:
+        """
+        Work out how long to wait before retrying a rate limited response.
+        
+        Returns:
+            float | None: Seconds to wait from Retry-After, the quota reset time or the
+                secondary rate limit minimum, or None if the response is not rate limited
+        """
+        if response.status_code not in (403, 429):
+            return None
+            
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None and retry_after.isdigit():
+            return min(int(retry_after), 3600)
+            
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            try:
                 reset_time = int(response.headers['X-RateLimit-Reset'])
-                sleep_time = reset_time - int(time.time()) + 1
-                if sleep_time > 0:
-                    time.sleep(min(sleep_time, 3600))  # Cap at 1 hour
+            except (KeyError, ValueError):
+                return self.SECONDARY_RATE_LIMIT_DELAY
+            sleep_time = reset_time - int(time.time()) + 1
+            return min(max(sleep_time, 0), 3600)  # Cap at 1 hour
+            
+        # Secondary rate limits come back as a 403 that only the message identifies.
+        if b'secondary rate limit' in response.content.lower():
+            return self.SECONDARY_RATE_LIMIT_DELAY
+        return None
+        
+    def _backoff_delay(self, attempt: int) -> float:
+        """Capped exponential backoff for the given retry attempt, with random jitter."""
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+        
+    def _pace(self, response: httpx.Response) -> None:
+        """
+        Update the spacing between requests from the response's rate limit headers.
+        
+        Once less than PACING_THRESHOLD of the quota remains, requests are spaced
+        (reset - now) / remaining seconds apart so the rest of the quota lasts the window.
+        """
+        try:
+            remaining = int(response.headers['X-RateLimit-Remaining'])
+            limit = int(response.headers['X-RateLimit-Limit'])
+            reset_time = int(response.headers['X-RateLimit-Reset'])
+        except (KeyError, ValueError):
+            return
+            
+        interval = 0.0
+        if remaining > 0 and limit > 0 and remaining / limit < self.PACING_THRESHOLD:
+            interval = min(max((reset_time - time.time()) / remaining, 0.0), 3600)
+        with self._pace_lock:
+            self._pace_interval = interval
+            if interval:
+                self._next_send_at = max(self._next_send_at, time.monotonic() + interval)
+            
+    def _wait_for_send_slot(self) -> None:
+        """Reserve the next paced send time and sleep until it arrives."""
+        with self._pace_lock:
+            now = time.monotonic()
+            send_at = max(now, self._next_send_at)
+            self._next_send_at = send_at + self._pace_interval
+        if send_at > now:
+            time.sleep(send_at - now)
+            
+    def _was_throttled(self, response: httpx.Response) -> bool:
+        """Check whether the response signals that GitHub is throttling or overloaded."""
+        if response.status_code in _THROTTLE_STATUSES:
+            return True
+        return self._rate_limit_delay(response) is not None
+        
+    @staticmethod
+    def _graphql_rate_limited(response: httpx.Response) -> bool:
+        """Check whether a GraphQL response reports rate limiting in its errors despite a 200."""
+        if response.status_code != 200 or b'RATE_LIMITED' not in response.content:
+            return False
+        errors = orjson.loads(response.content).get('errors') or ()
+        return any(error.get('type') == 'RATE_LIMITED' for error in errors)
+        
+    def _send(
+        self,
+        method: str,
+        url: str,
+        is_rate_limited: Callable[[httpx.Response], bool] | None = None,
+        **kwargs
+    ) -> httpx.Response:
+        """Send a single request once it is due under pacing, through the adaptive concurrency limiter."""
+        # Wait before taking a limiter slot so paced requests do not hold up unpaced capacity.
+        self._wait_for_send_slot()
+        self._limiter.acquire()
+        throttled = True
+        try:
+            response = self.session.request(method, url, **kwargs)
+            throttled = self._was_throttled(response) or (
+                is_rate_limited is not None and is_rate_limited(response)
+            )
+            self._pace(response)
+            return response
+        finally:
+            self._limiter.release(throttled)
                     
-    def _make_request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Make an HTTP request with rate limit handling and error checking."""
+    def _make_request(
+        self,
+        method: str,
+        url: str,
+        is_rate_limited: Callable[[httpx.Response], bool] | None = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Make an HTTP request with rate limit handling, retries and error checking.
+        
+        is_rate_limited, if given, flags responses that report rate limiting in their
+        body rather than their status; they are retried and throttled like a 429.
+        """
+        attempt = 0
         while True:
-            response = self.session.request(method, url, **kwargs)
-            
-            if response.status_code == 200:
-                return response
+            response = self._send(method, url, is_rate_limited, **kwargs)
             
-            if response.status_code == 403:
-                self._handle_rate_limit(response)
-                continue
+            delay = self._rate_limit_delay(response)
+            retryable = (
+                delay is not None
+                or response.status_code in _THROTTLE_STATUSES
+                or (is_rate_limited is not None and is_rate_limited(response))
+            )
+            if not retryable or attempt >= self.max_retries:
+                break
                 
+            if delay is None:
+                delay = self._backoff_delay(attempt)
+            time.sleep(delay)
+            attempt += 1
+            
+        if 400 <= response.status_code < 500 and not retryable:
+            raise UnrecoverableError(
+                f"{response.status_code} Client Error: {response.reason_phrase} for url: {response.url}",
+                request=response.request,
+                response=response
+            )
+        # 304 only comes back for conditional requests, whose callers serve their stored copy.
+        if response.status_code != 304:
             response.raise_for_status()
+        return response
+            
+    def _fetch_cached(self, key: Hashable, ttl: float, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key while it is fresh, otherwise call fetch and cache its result.
+        
+        Callers that miss the cache while the same key is already being fetched wait
+        for that fetch instead of issuing a duplicate request. Every caller receives the
+        same object, which must therefore not be mutated.
+        """
+        data = self._cache.get(key)
+        if data is not None:
+            return data
+            
+        with self._inflight_lock:
+            data = self._cache.get(key)
+            if data is not None:
+                return data
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = Future()
+                is_owner = True
+            else:
+                is_owner = False
+                
+        if not is_owner:
+            return future.result()
+            
+        try:
+            data = fetch()
+            self._cache.set(key, data, ttl)
+            future.set_result(data)
+            return data
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        
+    def _get_page(self, url: str, ttl: float, params: dict | None = None) -> tuple[Any, dict, str | None]:
+        """
+        GET a JSON resource with its Link relations and ETag, served from the TTL cache while fresh.
+        
+        Once the cached copy expires the request is made conditional on its ETag, so an
+        unchanged resource comes back as a 304 that does not count against the rate limit.
+        """
+        key = (url, frozenset(params.items()) if params else None)
+        
+        def fetch():
+            stale = self._cache.get_stale(key)
+            etag = stale[2] if stale is not None else None
+            headers = {'If-None-Match': etag} if etag else None
+            response = self._make_request('GET', url, params=params, headers=headers)
+            if response.status_code == 304 and etag:
+                return stale
+            return orjson.loads(response.content), response.links, response.headers.get('ETag')
             
-    def get_issue(self, owner: str, repo: str, issue_number: int) -> Dict:
+        return self._fetch_cached(key, ttl, fetch)
+        
+    def _get_json(self, url: str, ttl: float, params: dict | None = None) -> Any:
+        """GET a JSON resource, serving it from the TTL cache while it is fresh."""
+        return self._get_page(url, ttl, params)[0]
+        
+    def _get_all_pages(self, url: str, ttl: float, params: dict | None = None) -> list[dict]:
+        """
+        Fetch every page of a paginated listing.
+        
+        The first page's Link header gives the last page number, so the remaining
+        pages are requested concurrently rather than one after another.
+        """
+        params = dict(params or {}, per_page=100, page=1)
+        first_page, links, _ = self._get_page(url, ttl, params)
+        
+        match = _PAGE_PARAM_RE.search(links.get('last', {}).get('url', ''))
+        if not match:
+            return list(first_page)
+            
+        remaining_pages = self._run_concurrently(
+            lambda page: self._get_json(url, ttl, dict(params, page=page)),
+            [(page,) for page in range(2, int(match.group(1)) + 1)]
+        )
+        return [item for page in [first_page, *remaining_pages] for item in page]
+        
+    def _graphql(self, query: str, variables: dict) -> dict:
+        """Run a GraphQL v4 query and return its data, raising on GraphQL-level errors."""
+        response = self._make_request(
+            'POST',
+            f"{self.base_url}/graphql",
+            is_rate_limited=self._graphql_rate_limited,
+            content=orjson.dumps({'query': query, 'variables': variables}),
+            headers={'Content-Type': 'application/json'}
+        )
+        if self._graphql_rate_limited(response):
+            raise httpx.HTTPStatusError(
+                f"GraphQL rate limit still exceeded after {self.max_retries} retries",
+                request=response.request,
+                response=response
+            )
+        result = orjson.loads(response.content)
+        if result.get('errors'):
+            messages = '; '.join(error.get('message', '') for error in result['errors'])
+            raise UnrecoverableError(
+                f"GraphQL error: {messages}",
+                request=response.request,
+                response=response
+            )
+        return result['data']
+        
+    def close(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        self.session.close()
+        
+    def clear_cache(self) -> None:
+        """Discard all cached responses and ETags so the next calls fetch full responses."""
+        self._cache.clear()
+        
+    def _run_concurrently(
+        self,
+        func: Callable,
+        args_list: list[tuple],
+        max_workers: int | None = None
+    ) -> list:
+        """Call func once per argument tuple in a bounded thread pool, preserving input order."""
+        if not args_list:
+            return []
+        if len(args_list) == 1:
+            return [func(*args_list[0])]
+        
+        workers = min(max_workers or self.max_concurrency, len(args_list))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda args: func(*args), args_list))
+            
+    def get_issue(self, owner: str, repo: str, issue_number: int) -> dict:
         """
         Fetch a single issue by its number.
         
@@ -62,25 +525,41 @@ class GitHubIssueReader:
             issue_number (int): Issue number
             
         Returns:
-            Dict: Issue data
+            dict: Issue data
         """
         url = f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}"
-        response = self._make_request('GET', url)
-        return response.json()
+        return self._get_json(url, self.ISSUE_TTL)
+        
+    def get_issues_bulk(self, owner: str, repo: str, issue_numbers: list[int]) -> list[dict]:
+        """
+        Fetch several issues concurrently over the shared session.
+        
+        Args:
+            owner (str): Repository owner
+            repo (str): Repository name
+            issue_numbers (list[int]): Issue numbers to fetch
+            
+        Returns:
+            list[dict]: Issue data, in the same order as issue_numbers
+        """
+        return self._run_concurrently(
+            self.get_issue,
+            [(owner, repo, number) for number in issue_numbers]
+        )
         
     def list_issues(
         self,
         owner: str,
         repo: str,
         state: str = 'open',
-        labels: Optional[List[str]] = None,
-        assignee: Optional[str] = None,
-        creator: Optional[str] = None,
-        mentioned: Optional[str] = None,
-        since: Optional[Union[str, datetime]] = None,
+        labels: list[str] | None = None,
+        assignee: str | None = None,
+        creator: str | None = None,
+        mentioned: str | None = None,
+        since: str | datetime | None = None,
         per_page: int = 30,
         page: int = 1
-    ) -> List[Dict]:
+    ) -> list[dict]:
         """
         List issues in a repository with filtering options.
         
@@ -88,24 +567,67 @@ class GitHubIssueReader:
             owner (str): Repository owner
             repo (str): Repository name
             state (str): Issue state ('open', 'closed', 'all')
-            labels (List[str], optional): List of label names
+            labels (list[str], optional): List of label names
             assignee (str, optional): Username of assignee
             creator (str, optional): Username of issue creator
             mentioned (str, optional): Username mentioned in issue
-            since (Union[str, datetime], optional): Only issues updated after this time
+            since (str | datetime, optional): Only issues updated after this time
             per_page (int): Number of results per page (max 100)
             page (int): Page number for pagination
             
         Returns:
-            List[Dict]: List of issue data
+            list[dict]: List of issue data
         """
         url = f"{self.base_url}/repos/{owner}/{repo}/issues"
         
-        params = {
-            'state': state,
-            'per_page': min(per_page, 100),
-            'page': page
-        }
+        params = self._issue_filter_params(state, labels, assignee, creator, mentioned, since)
+        params['per_page'] = min(per_page, 100)
+        params['page'] = page
+        
+        return self._get_json(url, self.ISSUE_TTL, params=params)
+        
+    def list_all_issues(
+        self,
+        owner: str,
+        repo: str,
+        state: str = 'open',
+        labels: list[str] | None = None,
+        assignee: str | None = None,
+        creator: str | None = None,
+        mentioned: str | None = None,
+        since: str | datetime | None = None
+    ) -> list[dict]:
+        """
+        List every issue in a repository matching the filters, fetching pages concurrently.
+        
+        Args:
+            owner (str): Repository owner
+            repo (str): Repository name
+            state (str): Issue state ('open', 'closed', 'all')
+            labels (list[str], optional): List of label names
+            assignee (str, optional): Username of assignee
+            creator (str, optional): Username of issue creator
+            mentioned (str, optional): Username mentioned in issue
+            since (str | datetime, optional): Only issues updated after this time
+            
+        Returns:
+            list[dict]: List of issue data across all pages
+        """
+        url = f"{self.base_url}/repos/{owner}/{repo}/issues"
+        params = self._issue_filter_params(state, labels, assignee, creator, mentioned, since)
+        return self._get_all_pages(url, self.ISSUE_TTL, params=params)
+        
+    @staticmethod
+    def _issue_filter_params(
+        state: str,
+        labels: list[str] | None,
+        assignee: str | None,
+        creator: str | None,
+        mentioned: str | None,
+        since: str | datetime | None
+    ) -> dict:
+        """Build the query parameters shared by the issue listing endpoints."""
+        params = {'state': state}
         
         if labels:
             params['labels'] = ','.join(labels)
@@ -119,9 +641,7 @@ class GitHubIssueReader:
             if isinstance(since, datetime):
                 since = since.isoformat()
             params['since'] = since
-            
-        response = self._make_request('GET', url, params=params)
-        return response.json()
+        return params
         
     def get_issue_comments(
         self,
@@ -130,7 +650,7 @@ class GitHubIssueReader:
         issue_number: int,
         per_page: int = 30,
         page: int = 1
-    ) -> List[Dict]:
+    ) -> list[dict]:
         """
         Get comments for a specific issue.
         
@@ -142,7 +662,7 @@ class GitHubIssueReader:
             page (int): Page number for pagination
             
         Returns:
-            List[Dict]: List of comment data
+            list[dict]: List of comment data
         """
         url = f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}/comments"
         
@@ -151,11 +671,89 @@ class GitHubIssueReader:
             'page': page
         }
         
-        response = self._make_request('GET', url, params=params)
-        return response.json()
+        return self._get_json(url, self.COMMENTS_TTL, params=params)
+        
+    def get_issue_comments_all(self, owner: str, repo: str, issue_number: int) -> list[dict]:
+        """
+        Get every comment on an issue, fetching pages concurrently.
+        
+        Args:
+            owner (str): Repository owner
+            repo (str): Repository name
+            issue_number (int): Issue number
+            
+        Returns:
+            list[dict]: List of comment data across all pages
+        """
+        url = f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}/comments"
+        return self._get_all_pages(url, self.COMMENTS_TTL)
+        
+    def get_issue_with_comments(
+        self,
+        owner: str,
+        repo: str,
+        issue_number: int,
+        comment_limit: int = 100
+    ) -> dict:
+        """
+        Fetch an issue with its labels, assignees and first comments in a single GraphQL call.
+        
+        Like the REST issues endpoint, pull request numbers are accepted too.
+        
+        Args:
+            owner (str): Repository owner
+            repo (str): Repository name
+            issue_number (int): Issue or pull request number
+            comment_limit (int): Number of comments to include (max 100)
+            
+        Returns:
+            dict: GraphQL issue or pull request node; comments beyond comment_limit are flagged by
+                comments.pageInfo.hasNextPage
+        """
+        variables = {
+            'owner': owner,
+            'repo': repo,
+            'number': issue_number,
+            'commentLimit': min(comment_limit, 100)
+        }
+        key = ('graphql', owner, repo, issue_number, variables['commentLimit'])
+        return self._fetch_cached(
+            key,
+            self.COMMENTS_TTL,
+            lambda: self._graphql(_ISSUE_WITH_COMMENTS_QUERY, variables)['repository']['issueOrPullRequest']
+        )
+        
+    def get_issues_with_comments_bulk(
+        self,
+        refs: list[tuple[str, str, int]],
+        max_concurrency: int | None = None
+    ) -> list[dict]:
+        """
+        Fetch several issues or pull requests, possibly from different repositories, concurrently.
+        
+        Args:
+            refs (list[tuple[str, str, int]]): (owner, repo, issue_number) of each issue to fetch
+            max_concurrency (int, optional): Maximum number of issues fetched at once;
+                defaults to the reader's max_concurrency
+            
+        Returns:
+            list[dict]: GraphQL issue or pull request nodes, in the same order as refs
+        """
+        return self._run_concurrently(
+            self.get_issue_with_comments,
+            [tuple(ref) for ref in refs],
+            max_workers=max_concurrency
+        )
+
+@functools.lru_cache(maxsize=1)
+def _default_reader() -> GitHubIssueReader:
+    """Return the process-wide reader shared by the MCP functions, creating it on first use."""
+    reader = GitHubIssueReader()
+    atexit.register(reader.close)
+    return reader
 
 # Example Claude MCP function implementation
-def mcp_get_issue(owner: str, repo: str, issue_number: int) -> Dict:
+def mcp_get_issue(owner: str, repo: str, issue_number: int) -> dict:
     """
     MCP function to get a single GitHub issue.
     
@@ -165,23 +763,48 @@ def mcp_get_issue(owner: str, repo: str, issue_number: int) -> Dict:
         issue_number (int): Issue number
         
     Returns:
-        Dict: Formatted issue data for Claude MCP
+        dict: Formatted issue data, including its comments, for Claude MCP
     """
-    reader = GitHubIssueReader()
-    issue_data = reader.get_issue(owner, repo, issue_number)
+    reader = _default_reader()
+    issue_data = reader.get_issue_with_comments(owner, repo, issue_number)
+    return _format_issue(issue_data)
+
+def mcp_get_issues_bulk(refs: list[tuple[str, str, int]], max_concurrency: int = 8) -> list[dict]:
+    """
+    MCP function to get several GitHub issues, possibly from different repositories, in parallel.
     
-    # Transform data into MCP-friendly format
+    Args:
+        refs (list[tuple[str, str, int]]): (owner, repo, issue_number) of each issue to fetch
+        max_concurrency (int): Maximum number of issues fetched at once
+        
+    Returns:
+        list[dict]: Formatted issue data for Claude MCP, in the same order as refs
+    """
+    reader = _default_reader()
+    issues_data = reader.get_issues_with_comments_bulk(refs, max_concurrency=max_concurrency)
+    return [_format_issue(issue_data) for issue_data in issues_data]
+
+def _format_issue(issue_data: dict) -> dict:
+    """Transform a GraphQL issue or pull request node into the MCP-friendly format."""
+    # GraphQL reports empty bodies as "" and merged pull requests as MERGED, where REST
+    # returns None and 'closed'; keep the REST values so both MCP functions agree.
+    state = issue_data['state'] if 'state' in issue_data else issue_data['pullRequestState']
     return {
         'title': issue_data['title'],
-        'body': issue_data['body'],
-        'state': issue_data['state'],
+        'body': issue_data['body'] or None,
+        'state': 'closed' if state == 'MERGED' else state.lower(),
         'number': issue_data['number'],
-        'created_at': issue_data['created_at'],
-        'updated_at': issue_data['updated_at'],
-        'labels': [label['name'] for label in issue_data['labels']],
-        'assignees': [assignee['login'] for assignee in issue_data['assignees']],
-        'comments_count': issue_data['comments'],
-        'url': issue_data['html_url']
+        'created_at': issue_data['createdAt'],
+        'updated_at': issue_data['updatedAt'],
+        'labels': [label['name'] for label in issue_data['labels']['nodes']],
+        'assignees': [assignee['login'] for assignee in issue_data['assignees']['nodes']],
+        'comments_count': issue_data['comments']['totalCount'],
+        'comments': [{
+            'author': comment['author']['login'] if comment['author'] else None,
+            'body': comment['body'],
+            'created_at': comment['createdAt']
+        } for comment in issue_data['comments']['nodes']],
+        'url': issue_data['url']
     }
 
 # Example Claude MCP function implementation
@@ -189,11 +812,11 @@ def mcp_list_issues(
     owner: str,
     repo: str,
     state: str = 'open',
-    labels: Optional[List[str]] = None,
-    assignee: Optional[str] = None,
+    labels: list[str] | None = None,
+    assignee: str | None = None,
     per_page: int = 30,
     page: int = 1
-) -> List[Dict]:
+) -> list[dict]:
     """
     MCP function to list GitHub issues with filtering.
     
@@ -201,15 +824,15 @@ def mcp_list_issues(
         owner (str): Repository owner
         repo (str): Repository name
         state (str): Issue state
-        labels (List[str], optional): List of label names
+        labels (list[str], optional): List of label names
         assignee (str, optional): Username of assignee
         per_page (int): Results per page
         page (int): Page number
         
     Returns:
-        List[Dict]: List of formatted issue data for Claude MCP
+        list[dict]: List of formatted issue data for Claude MCP
     """
-    reader = GitHubIssueReader()
+    reader = _default_reader()
     issues_data = reader.list_issues(
         owner=owner,
         repo=repo,
@@ -232,4 +855,44 @@ def mcp_list_issues(
         'assignees': [assignee['login'] for assignee in issue['assignees']],
         'comments_count': issue['comments'],
         'url': issue['html_url']
-    } for issue in issues_data]
\ No newline at end of file
+    } for issue in issues_data]
+
+def mcp_get_issue_bytes(owner: str, repo: str, issue_number: int) -> bytes:
+    """
+    MCP function to get a single GitHub issue as pre-encoded JSON.
+    
+    Args:
+        owner (str): Repository owner
+        repo (str): Repository name
+        issue_number (int): Issue number
+        
+    Returns:
+        bytes: UTF-8 JSON encoding of mcp_get_issue's result
+    """
+    return orjson.dumps(mcp_get_issue(owner, repo, issue_number))
+
+def mcp_list_issues_bytes(
+    owner: str,
+    repo: str,
+    state: str = 'open',
+    labels: list[str] | None = None,
+    assignee: str | None = None,
+    per_page: int = 30,
+    page: int = 1
+) -> bytes:
+    """
+    MCP function to list GitHub issues as pre-encoded JSON.
+    
+    Args:
+        owner (str): Repository owner
+        repo (str): Repository name
+        state (str): Issue state
+        labels (list[str], optional): List of label names
+        assignee (str, optional): Username of assignee
+        per_page (int): Results per page
+        page (int): Page number
+        
+    Returns:
+        bytes: UTF-8 JSON encoding of mcp_list_issues's result
+    """
+    return orjson.dumps(mcp_list_issues(owner, repo, state, labels, assignee, per_page, page))
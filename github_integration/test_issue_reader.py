@@ -0,0 +1,528 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import orjson
+import pytest
+
+import issue_reader
+from issue_reader import GitHubIssueReader, UnrecoverableError
+
+
+def make_reader(handler, **kwargs) -> GitHubIssueReader:
+    """Build a reader whose requests are answered by handler instead of the network."""
+    kwargs.setdefault('base_delay', 0)
+    kwargs.setdefault('jitter', 0)
+    return GitHubIssueReader(token='test-token', transport=httpx.MockTransport(handler), **kwargs)
+
+
+def test_get_issue_follows_redirects():
+    def handler(request):
+        if request.url.path == '/repos/old/repo/issues/1':
+            return httpx.Response(301, headers={'Location': 'https://api.github.com/repos/new/repo/issues/1'})
+        return httpx.Response(200, json={'number': 1, 'path': request.url.path})
+
+    reader = make_reader(handler)
+
+    assert reader.get_issue('old', 'repo', 1) == {'number': 1, 'path': '/repos/new/repo/issues/1'}
+
+
+def graphql_node(number, state_field='state', state='OPEN', body='Body'):
+    return {
+        state_field: state,
+        'title': f'Title {number}',
+        'body': body,
+        'number': number,
+        'createdAt': '2024-01-01T00:00:00Z',
+        'updatedAt': '2024-01-02T00:00:00Z',
+        'url': f'https://github.com/owner/repo/issues/{number}',
+        'labels': {'nodes': [{'name': 'bug'}]},
+        'assignees': {'nodes': [{'login': 'octocat'}]},
+        'comments': {
+            'totalCount': 1,
+            'nodes': [{'author': None, 'body': 'Hi', 'createdAt': '2024-01-03T00:00:00Z'}],
+            'pageInfo': {'hasNextPage': False, 'endCursor': None}
+        }
+    }
+
+
+def test_mcp_get_issue_accepts_pull_requests(monkeypatch):
+    def handler(request):
+        assert b'issueOrPullRequest' in request.content
+        node = graphql_node(7, state_field='pullRequestState', state='MERGED', body='')
+        return httpx.Response(200, json={'data': {'repository': {'issueOrPullRequest': node}}})
+
+    reader = make_reader(handler)
+    monkeypatch.setattr(issue_reader, '_default_reader', lambda: reader)
+
+    issue = issue_reader.mcp_get_issue('owner', 'repo', 7)
+
+    assert issue['number'] == 7
+    assert issue['state'] == 'closed'
+    assert issue['body'] is None
+    assert issue['labels'] == ['bug']
+    assert issue['assignees'] == ['octocat']
+    assert issue['comments'] == [{'author': None, 'body': 'Hi', 'created_at': '2024-01-03T00:00:00Z'}]
+
+
+def test_mcp_get_issues_bulk_preserves_order_and_mixes_pull_requests(monkeypatch):
+    def handler(request):
+        variables = orjson.loads(request.content)['variables']
+        if variables['number'] == 2:
+            node = graphql_node(2, state_field='pullRequestState', state='OPEN')
+        else:
+            node = graphql_node(variables['number'])
+        return httpx.Response(200, json={'data': {'repository': {'issueOrPullRequest': node}}})
+
+    reader = make_reader(handler)
+    monkeypatch.setattr(issue_reader, '_default_reader', lambda: reader)
+
+    issues = issue_reader.mcp_get_issues_bulk(
+        [('owner', 'repo', 3), ('owner', 'repo', 2), ('other', 'repo', 1)],
+        max_concurrency=2
+    )
+
+    assert [issue['number'] for issue in issues] == [3, 2, 1]
+    assert [issue['state'] for issue in issues] == ['open', 'open', 'open']
+
+
+def test_server_errors_retry_with_backoff_until_max_retries(monkeypatch):
+    delays = []
+    monkeypatch.setattr(issue_reader.time, 'sleep', delays.append)
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(503)
+
+    reader = make_reader(handler, max_retries=2, base_delay=1.0)
+
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        reader.get_issue('owner', 'repo', 1)
+
+    assert not isinstance(excinfo.value, UnrecoverableError)
+    assert excinfo.value.response.status_code == 503
+    assert len(requests_seen) == 3
+    assert delays == [1.0, 2.0]
+
+
+def test_transient_server_error_is_retried_to_success(monkeypatch):
+    monkeypatch.setattr(issue_reader.time, 'sleep', lambda delay: None)
+    responses = [httpx.Response(502), httpx.Response(200, json={'number': 1})]
+
+    reader = make_reader(lambda request: responses.pop(0))
+
+    assert reader.get_issue('owner', 'repo', 1) == {'number': 1}
+    assert responses == []
+
+
+def test_client_error_raises_unrecoverable_without_retrying(monkeypatch):
+    delays = []
+    monkeypatch.setattr(issue_reader.time, 'sleep', delays.append)
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(404)
+
+    reader = make_reader(handler)
+
+    with pytest.raises(UnrecoverableError) as excinfo:
+        reader.get_issue('owner', 'repo', 1)
+
+    assert excinfo.value.response.status_code == 404
+    assert len(requests_seen) == 1
+    assert delays == []
+
+
+def test_list_all_issues_fetches_remaining_pages_from_link_header():
+    pages_seen = []
+
+    def handler(request):
+        page = int(request.url.params['page'])
+        pages_seen.append(page)
+        assert request.url.params['per_page'] == '100'
+        assert request.url.params['labels'] == 'bug,ui'
+        headers = {}
+        if page == 1:
+            last = request.url.copy_set_param('page', 3)
+            headers['Link'] = f'<{request.url.copy_set_param("page", 2)}>; rel="next", <{last}>; rel="last"'
+        return httpx.Response(200, json=[{'number': page * 10}, {'number': page * 10 + 1}], headers=headers)
+
+    reader = make_reader(handler)
+
+    issues = reader.list_all_issues('owner', 'repo', labels=['bug', 'ui'])
+
+    assert [issue['number'] for issue in issues] == [10, 11, 20, 21, 30, 31]
+    assert sorted(pages_seen) == [1, 2, 3]
+
+
+def test_get_issue_comments_all_returns_single_page_without_link_header():
+    pages_seen = []
+
+    def handler(request):
+        pages_seen.append(request.url.params['page'])
+        return httpx.Response(200, json=[{'id': 1}])
+
+    reader = make_reader(handler)
+
+    assert reader.get_issue_comments_all('owner', 'repo', 1) == [{'id': 1}]
+    assert pages_seen == ['1']
+
+
+def test_expired_response_is_revalidated_with_etag(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(issue_reader.time, 'monotonic', lambda: now[0])
+    conditional_headers = []
+
+    def handler(request):
+        conditional_headers.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304, headers={'ETag': '"v1"'})
+        return httpx.Response(200, json={'number': 1}, headers={'ETag': '"v1"'})
+
+    reader = make_reader(handler)
+
+    first = reader.get_issue('owner', 'repo', 1)
+    assert reader.get_issue('owner', 'repo', 1) is first
+    now[0] += GitHubIssueReader.ISSUE_TTL + 1
+    revalidated = reader.get_issue('owner', 'repo', 1)
+
+    assert revalidated == {'number': 1}
+    assert conditional_headers == [None, '"v1"']
+
+
+def run_concurrent_get_issue(reader, entered, release, callers=8):
+    """Call get_issue from several threads while the first request is held open."""
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        futures = [executor.submit(reader.get_issue, 'owner', 'repo', 1) for _ in range(callers)]
+        assert entered.wait(timeout=5)
+        time.sleep(0.1)  # let the other callers reach the in-flight Future
+        release.set()
+        return futures
+
+
+def test_concurrent_duplicate_requests_share_one_fetch():
+    entered, release = threading.Event(), threading.Event()
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        entered.set()
+        release.wait(timeout=5)
+        return httpx.Response(200, json={'number': 1})
+
+    reader = make_reader(handler)
+
+    futures = run_concurrent_get_issue(reader, entered, release)
+
+    assert [future.result() for future in futures] == [{'number': 1}] * 8
+    assert len(requests_seen) == 1
+    assert reader._inflight == {}
+
+
+def test_failed_fetch_propagates_to_waiting_callers():
+    entered, release = threading.Event(), threading.Event()
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        entered.set()
+        release.wait(timeout=5)
+        return httpx.Response(404)
+
+    reader = make_reader(handler)
+
+    futures = run_concurrent_get_issue(reader, entered, release)
+
+    for future in futures:
+        with pytest.raises(UnrecoverableError):
+            future.result()
+    assert len(requests_seen) == 1
+    assert reader._inflight == {}
+
+    # The failure is not cached, so the next call fetches again.
+    with pytest.raises(UnrecoverableError):
+        reader.get_issue('owner', 'repo', 1)
+    assert len(requests_seen) == 2
+
+
+def test_ttl_cache_evicts_least_recently_used_entry_at_maxsize():
+    cache = issue_reader._TTLCache(maxsize=2)
+    cache.set('a', 1, ttl=60)
+    cache.set('b', 2, ttl=60)
+    assert cache.get('a') == 1  # 'b' is now the least recently used entry
+    cache.set('c', 3, ttl=60)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_cache_maxsize_zero_disables_caching():
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, json={'number': 1})
+
+    reader = make_reader(handler, cache_maxsize=0)
+
+    reader.get_issue('owner', 'repo', 1)
+    reader.get_issue('owner', 'repo', 1)
+
+    assert len(requests_seen) == 2
+
+
+def test_comments_expire_before_issues(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(issue_reader.time, 'monotonic', lambda: now[0])
+    paths_seen = []
+
+    def handler(request):
+        paths_seen.append(request.url.path)
+        return httpx.Response(200, json=[] if request.url.path.endswith('/comments') else {'number': 1})
+
+    reader = make_reader(handler)
+    reader.get_issue('owner', 'repo', 1)
+    reader.get_issue_comments('owner', 'repo', 1)
+
+    now[0] += GitHubIssueReader.COMMENTS_TTL + 1
+    reader.get_issue('owner', 'repo', 1)
+    reader.get_issue_comments('owner', 'repo', 1)
+    assert paths_seen == [
+        '/repos/owner/repo/issues/1',
+        '/repos/owner/repo/issues/1/comments',
+        '/repos/owner/repo/issues/1/comments'
+    ]
+
+    now[0] += GitHubIssueReader.ISSUE_TTL - GitHubIssueReader.COMMENTS_TTL
+    reader.get_issue('owner', 'repo', 1)
+    assert paths_seen[-1] == '/repos/owner/repo/issues/1'
+    assert len(paths_seen) == 4
+
+
+def test_adaptive_limiter_halves_on_throttle_and_grows_after_successes():
+    limiter = issue_reader._AdaptiveLimiter(max_limit=8)
+
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 4.0
+
+    for _ in range(9):
+        limiter.acquire()
+        limiter.release(throttled=False)
+    assert limiter.limit == 4.0
+    limiter.acquire()
+    limiter.release(throttled=False)
+    assert limiter.limit == 4.5
+
+
+def test_adaptive_limiter_stays_within_bounds():
+    limiter = issue_reader._AdaptiveLimiter(max_limit=2)
+
+    for _ in range(5):
+        limiter.acquire()
+        limiter.release(throttled=True)
+    assert limiter.limit == 1
+
+    for _ in range(100):
+        limiter.acquire()
+        limiter.release(throttled=False)
+    assert limiter.limit == 2
+
+
+def test_adaptive_limiter_blocks_beyond_current_limit():
+    limiter = issue_reader._AdaptiveLimiter(max_limit=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def acquire_second_slot():
+        limiter.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=acquire_second_slot)
+    thread.start()
+    assert not acquired.wait(timeout=0.1)
+
+    limiter.release(throttled=False)
+    assert acquired.wait(timeout=5)
+    thread.join()
+
+
+def rate_limit_headers(remaining, limit=100, reset_in=10):
+    return {
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Limit': str(limit),
+        'X-RateLimit-Reset': str(1_000_000 + reset_in)
+    }
+
+
+@pytest.mark.parametrize('headers, expected', [
+    (rate_limit_headers(remaining=50), 0.0),
+    (rate_limit_headers(remaining=0), 0.0),
+    (rate_limit_headers(remaining=5, reset_in=10), 2.0),
+    (rate_limit_headers(remaining=1, reset_in=100_000), 3600),
+])
+def test_pace_interval_follows_rate_limit_headers(monkeypatch, headers, expected):
+    monkeypatch.setattr(issue_reader.time, 'time', lambda: 1_000_000)
+    reader = make_reader(lambda request: httpx.Response(200))
+
+    reader._pace(httpx.Response(200, headers=headers))
+
+    assert reader._pace_interval == expected
+
+
+def test_pace_ignores_responses_without_rate_limit_headers(monkeypatch):
+    monkeypatch.setattr(issue_reader.time, 'time', lambda: 1_000_000)
+    reader = make_reader(lambda request: httpx.Response(200))
+
+    reader._pace(httpx.Response(200, headers=rate_limit_headers(remaining=5, reset_in=10)))
+    reader._pace(httpx.Response(200))
+
+    assert reader._pace_interval == 2.0
+
+
+def test_pacing_spaces_requests_across_threads(monkeypatch):
+    monkeypatch.setattr(issue_reader.time, 'time', lambda: 1_000_000)
+    monkeypatch.setattr(issue_reader.time, 'monotonic', lambda: 500.0)
+    sleeps = []
+    monkeypatch.setattr(issue_reader.time, 'sleep', sleeps.append)
+
+    def handler(request):
+        return httpx.Response(200, json={}, headers=rate_limit_headers(remaining=5, reset_in=10))
+
+    reader = make_reader(handler)
+    reader.get_issue('owner', 'repo', 1)
+    reader.get_issues_bulk('owner', 'repo', [2, 3, 4, 5])
+
+    # The clock is frozen, so each reservation lands one 2 s interval after the last.
+    assert sorted(sleeps) == [2.0, 4.0, 6.0, 8.0]
+
+
+def test_secondary_rate_limit_403_waits_at_least_a_minute(monkeypatch):
+    delays = []
+    monkeypatch.setattr(issue_reader.time, 'sleep', delays.append)
+    responses = [
+        httpx.Response(403, json={'message': 'You have exceeded a secondary rate limit. Please wait.'}),
+        httpx.Response(200, json={'number': 1})
+    ]
+
+    reader = make_reader(lambda request: responses.pop(0))
+
+    assert reader.get_issue('owner', 'repo', 1) == {'number': 1}
+    assert delays == [GitHubIssueReader.SECONDARY_RATE_LIMIT_DELAY]
+    assert reader._limiter.limit == 4.0
+
+
+def test_exhausted_quota_without_reset_header_falls_back_to_minimum_wait(monkeypatch):
+    delays = []
+    monkeypatch.setattr(issue_reader.time, 'sleep', delays.append)
+    responses = [
+        httpx.Response(403, headers={'X-RateLimit-Remaining': '0'}),
+        httpx.Response(200, json={'number': 1})
+    ]
+
+    reader = make_reader(lambda request: responses.pop(0))
+
+    assert reader.get_issue('owner', 'repo', 1) == {'number': 1}
+    assert delays == [GitHubIssueReader.SECONDARY_RATE_LIMIT_DELAY]
+
+
+def test_plain_forbidden_is_unrecoverable(monkeypatch):
+    monkeypatch.setattr(issue_reader.time, 'sleep', lambda delay: pytest.fail('should not retry'))
+    reader = make_reader(lambda request: httpx.Response(403, json={'message': 'Resource not accessible'}))
+
+    with pytest.raises(UnrecoverableError):
+        reader.get_issue('owner', 'repo', 1)
+
+
+def graphql_rate_limited_response():
+    return httpx.Response(200, json={
+        'data': None,
+        'errors': [{'type': 'RATE_LIMITED', 'message': 'API rate limit exceeded'}]
+    })
+
+
+def test_graphql_rate_limited_error_is_retried_and_throttles(monkeypatch):
+    delays = []
+    monkeypatch.setattr(issue_reader.time, 'sleep', delays.append)
+    node = graphql_node(1)
+    responses = [
+        graphql_rate_limited_response(),
+        httpx.Response(200, json={'data': {'repository': {'issueOrPullRequest': node}}})
+    ]
+
+    reader = make_reader(lambda request: responses.pop(0), base_delay=1.0)
+
+    assert reader.get_issue_with_comments('owner', 'repo', 1) == node
+    assert delays == [1.0]
+    assert reader._limiter.limit == 4.0
+
+
+def test_graphql_rate_limited_error_raises_retryable_error_when_exhausted(monkeypatch):
+    monkeypatch.setattr(issue_reader.time, 'sleep', lambda delay: None)
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return graphql_rate_limited_response()
+
+    reader = make_reader(handler, max_retries=2)
+
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        reader.get_issue_with_comments('owner', 'repo', 1)
+
+    assert not isinstance(excinfo.value, UnrecoverableError)
+    assert len(requests_seen) == 3
+
+
+def test_graphql_not_found_is_unrecoverable(monkeypatch):
+    monkeypatch.setattr(issue_reader.time, 'sleep', lambda delay: pytest.fail('should not retry'))
+
+    def handler(request):
+        return httpx.Response(200, json={
+            'data': {'repository': {'issueOrPullRequest': None}},
+            'errors': [{'type': 'NOT_FOUND', 'message': 'Could not resolve to an issue or pull request'}]
+        })
+
+    reader = make_reader(handler)
+
+    with pytest.raises(UnrecoverableError, match='Could not resolve'):
+        reader.get_issue_with_comments('owner', 'repo', 1)
+
+
+def test_ttl_cache_keeps_expired_entries_for_revalidation(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(issue_reader.time, 'monotonic', lambda: now[0])
+    cache = issue_reader._TTLCache(maxsize=2)
+    cache.set('a', 1, ttl=10)
+
+    now[0] += 11
+
+    assert cache.get('a') is None
+    assert cache.get_stale('a') == 1
+    assert cache.get_stale('missing') is None
+
+
+def test_etag_is_stored_with_the_single_cached_copy(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(issue_reader.time, 'monotonic', lambda: now[0])
+    conditional_headers = []
+
+    def handler(request):
+        conditional_headers.append(request.headers.get('If-None-Match'))
+        return httpx.Response(200, json={'path': request.url.path}, headers={'ETag': f'"{request.url.path}"'})
+
+    reader = make_reader(handler, cache_maxsize=1)
+    reader.get_issue('owner', 'repo', 1)
+    assert len(reader._cache._data) == 1
+
+    # Evicting the entry drops its ETag too, so the next fetch is unconditional.
+    reader.get_issue('owner', 'repo', 2)
+    now[0] += GitHubIssueReader.ISSUE_TTL + 1
+    reader.get_issue('owner', 'repo', 1)
+
+    assert conditional_headers == [None, None, None]
+    assert len(reader._cache._data) == 1